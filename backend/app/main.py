@@ -34,7 +34,3 @@ async def root():
         "message": "Luno Trading Bot API is running",
         "version": "0.1.0"
     })
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
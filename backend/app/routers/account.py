@@ -1,12 +1,12 @@
 """ Account management routes for Luno API """
 import random
 from fastapi import APIRouter, HTTPException, Body, BackgroundTasks
-from luno_python.client import Client as LunoClient
+from fastapi.concurrency import run_in_threadpool
 
 # pylint: disable=relative-beyond-top-level, broad-exception-caught
 from ..models.schemas import AccountBalance, ApiKeyConfig
 from ..utils.storage import ApiKeyStorage
-from ..services.luno_api import create_luno_api
+from ..services.luno_api import create_luno_api, get_public_luno_api
 
 router = APIRouter()
 
@@ -32,7 +32,7 @@ async def get_account_balance():
             )
 
             # In production, this would fetch real balances from Luno
-            balances = luno_client.get_balance()
+            balances = await run_in_threadpool(luno_client.get_balance)
 
             # For demo/fallback, use mock data if needed
             if not balances or "balance" not in balances:
@@ -83,8 +83,8 @@ async def save_api_keys(background_tasks: BackgroundTasks, api_keys: ApiKeyConfi
         # 1. Encrypt the API keys before storing
         # 2. Validate the keys with Luno API
 
-        # Store the keys
-        ApiKeyStorage.save_api_keys({
+        # Store the keys off the event loop since this is a blocking file write
+        await run_in_threadpool(ApiKeyStorage.save_api_keys, {
             "luno_api_key": api_keys.api_key,
             "luno_api_secret": api_keys.api_secret
         })
@@ -120,7 +120,7 @@ async def check_api_keys_status():
         )
 
         # Simple validation - try to get balances
-        luno_client.get_balance()
+        await run_in_threadpool(luno_client.get_balance)
 
         return {
             "configured": True,
@@ -142,11 +142,11 @@ async def get_markets():
     try:
         # First try to get markets without authentication as it's a public endpoint
 
-        luno_client = LunoClient()
+        luno_client = get_public_luno_api()
 
         # Try to get tickers which contains all available pairs
         try:
-            tickers_response = luno_client.get_tickers()
+            tickers_response = await run_in_threadpool(luno_client.get_tickers)
             if (tickers_response and "tickers" in tickers_response and
                 len(tickers_response["tickers"]) > 0):
                 # Convert tickers to markets format
@@ -200,7 +200,7 @@ async def get_markets():
             )
 
             # Get markets from Luno API
-            markets = luno_client.get_markets()
+            markets = await run_in_threadpool(luno_client.get_markets)
             return {"markets": markets}
     except Exception as e:
         # Log the exception but continue to default markets
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Body, Query, Depends
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional
 import random
 from datetime import datetime, timedelta
@@ -48,10 +49,9 @@ async def create_model(model: ModelCreate = Body(...)):
         num_points = len(model_dict["labeled_points"])
         model_accuracy = min(0.5 + (num_points / 200), 0.95)  # More points = higher accuracy, up to 95%
         
-        # Add model to storage with calculated accuracy
-        created_model = ModelStorage.add_model(model_dict)
-        created_model["accuracy"] = round(model_accuracy, 2)
-        ModelStorage.update_model(created_model["id"], {"accuracy": created_model["accuracy"]})
+        # Add model to storage with calculated accuracy in a single write
+        created_model = await run_in_threadpool(
+            ModelStorage.add_model, model_dict, accuracy=round(model_accuracy, 2))
         
         return created_model
     except Exception as e:
@@ -83,7 +83,7 @@ async def run_model(
         
         # Update the model's last_run timestamp
         now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        ModelStorage.update_model(model_id, {"last_run": now})
+        await run_in_threadpool(ModelStorage.update_model, model_id, {"last_run": now})
         
         return signals
     except Exception as e:
@@ -4,18 +4,18 @@ from datetime import datetime, timedelta
 import random
 import logging
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 try:
-    from luno_python.client import Client as LunoClient
+    import luno_python  # pylint: disable=unused-import
 except ImportError:
     print("Luno Python client not found. Attempting auto-install...")
     import subprocess
     import sys
     subprocess.check_call([sys.executable, "-m", "pip", "install", "luno-python"])
-    from luno_python.client import Client as LunoClient
 # pylint: disable=relative-beyond-top-level, broad-exception-caught
 from ..models.schemas import CryptoPrice
 from ..utils.storage import PriceStorage, ApiKeyStorage
-from ..services.luno_api import create_luno_api
+from ..services.luno_api import create_luno_api, get_public_luno_api
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -32,12 +32,11 @@ async def get_order_book(
     """
     try:
         try:
-            # Create a Luno client without API keys since they're not required for public endpoints
-
-            luno_client = LunoClient()
+            # Use the shared client without API keys since they're not required for public endpoints
+            luno_client = get_public_luno_api()
 
             # Get order book data from Luno
-            order_book = luno_client.get_order_book(pair=symbol)
+            order_book = await run_in_threadpool(luno_client.get_order_book, symbol)
             if order_book:
                 return {
                     "timestamp": datetime.now().isoformat(),
@@ -158,15 +157,16 @@ async def get_candle_data(
                     api_secret=api_keys["luno_api_secret"]
                 )
 
-                # Convert since in ms since epoch to human-readable format
-                since_timestamp = (datetime.fromtimestamp(int(since_ms) / 1000).isoformat()
-                                   if since_ms else None)
-
-                logger.info("Getting candles for %s with duration %ss, since: %s",
-                             symbol, interval_seconds, since_timestamp)
+                # Only build the human-readable timestamp if it will actually be logged
+                if logger.isEnabledFor(logging.INFO):
+                    since_timestamp = (datetime.fromtimestamp(int(since_ms) / 1000).isoformat()
+                                       if since_ms else None)
+                    logger.info("Getting candles for %s with duration %ss, since: %s",
+                                symbol, interval_seconds, since_timestamp)
 
                 # Call Luno API with the exact parameters it expects
-                candle_data = luno_client.get_candles(
+                candle_data = await run_in_threadpool(
+                    luno_client.get_candles,
                     pair=symbol,
                     duration=interval_seconds,
                     since=since_ms
@@ -186,7 +186,7 @@ async def get_candle_data(
         # If no cached data, generate mock data
         if not prices:
             prices = generate_mock_price_data(symbol, interval)
-            PriceStorage.save_prices(symbol, interval, prices)
+            await run_in_threadpool(PriceStorage.save_prices, symbol, interval, prices)
 
         return prices
     except Exception as e:
@@ -259,16 +259,14 @@ async def get_trade_data(
                     api_secret=api_keys["luno_api_secret"]
                 )
 
-                # The timestamp conversion is now handled in the LunoClientWrapper
-                # so we can pass the human-readable timestamp directly
-                # Convert since in ms since epoch to human-readable format
-                since_timestamp = (datetime.fromtimestamp(int(since) / 1000).isoformat()
-                                   if since else None)
-
-                logger.info("Getting trades for %s since %s", symbol, since_timestamp)
+                # Timestamp conversion is handled by LunoAPI.get_trades, so pass
+                # the human-readable or millisecond timestamp straight through
+                logger.info("Getting trades for %s since %s", symbol, since)
 
                 # Get recent trades from Luno
-                trades_response = luno_client.get_trades(pair=symbol, since=since)
+                trades_response = await run_in_threadpool(
+                    luno_client.get_trades, pair=symbol, since=since
+                )
                 if trades_response and "trades" in trades_response:
                     if trades_response["trades"] is None:
                         return {
@@ -370,7 +368,7 @@ async def get_live_price(
                 )
 
                 # Get ticker data from Luno
-                ticker = luno_client.get_ticker(pair=symbol)
+                ticker = await run_in_threadpool(luno_client.get_ticker, pair=symbol)
                 if ticker and 'last_trade' in ticker:
                     return {
                         "time": datetime.now().strftime("%H:%M:%S"),
@@ -388,7 +386,7 @@ async def get_live_price(
         if not prices:
             # Generate sample data if none exists
             prices = generate_mock_price_data(symbol, "1h")
-            PriceStorage.save_prices(symbol, "1h", prices)
+            await run_in_threadpool(PriceStorage.save_prices, symbol, "1h", prices)
 
         # Take the last price and add a small random change
         last_price = prices[-1]["price"]
@@ -404,18 +402,21 @@ async def get_live_price(
         raise HTTPException(status_code=500, detail=f"Error fetching live price: {str(e)}") from e
 
 @router.get("/tickers")
-async def get_all_tickers():
+async def get_all_tickers(
+    symbols: Optional[List[str]] = Query(None, alias="symbol",
+        description="Trading pairs to include, repeatable (e.g., symbol=XBTZAR&symbol=ETHZAR)")
+):
     """
-    Get ticker information for all available trading pairs on Luno
+    Get ticker information for all available trading pairs on Luno, or only the
+    requested pairs in a single upstream request
     """
     try:
         try:
-            # Create a Luno client without API keys since they're not required for public endpoints
-            # from luno_python.client import Client as LunoClient
-            luno_client = LunoClient()
+            # Use the shared client without API keys since they're not required for public endpoints
+            luno_client = get_public_luno_api()
 
-            # Get all tickers from Luno
-            tickers = luno_client.get_tickers()
+            # Get tickers from Luno
+            tickers = await run_in_threadpool(luno_client.get_tickers, symbols)
             if tickers and "tickers" in tickers:
                 return {
                     "timestamp": datetime.now().isoformat(),
@@ -426,7 +427,11 @@ async def get_all_tickers():
             # Continue to mock data if Luno API fails
 
         # If Luno API fails, generate mock ticker data
-        return generate_mock_tickers()
+        mock_tickers = generate_mock_tickers()
+        if symbols:
+            mock_tickers["tickers"] = [ticker for ticker in mock_tickers["tickers"]
+                                       if ticker["pair"] in symbols]
+        return mock_tickers
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching tickers: {str(e)}") from e
 
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, HTTPException, Body, Depends, BackgroundTasks
-from typing import List
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional
 from datetime import datetime, timedelta
 import random
 import logging
+import threading
 
 from ..models.schemas import TradingConfig, TradingResponse, Trade
 from ..utils.storage import ModelStorage, TradeStorage, ApiKeyStorage
@@ -49,22 +51,25 @@ async def start_trading(background_tasks: BackgroundTasks, config: TradingConfig
         
         # Validate trading pair by checking if it's available on Luno
         try:
-            ticker = luno_client.get_ticker(pair=config.symbol)
+            ticker = await run_in_threadpool(luno_client.get_ticker, pair=config.symbol)
             if not ticker:
                 raise HTTPException(
                     status_code=400, 
                     detail=f"Trading pair {config.symbol} not available on Luno"
                 )
         except Exception as e:
-            logger.warning(f"Error validating trading pair: {str(e)}")
+            logger.warning("Error validating trading pair: %s", e)
             # Allow trading to start even if validation fails (might be a temporary issue)
         
         # Set up active trading session
         active_trading_session = {
             "model_id": config.trading_model_id,
+            "model_name": model["name"],
             "symbol": config.symbol,
             "live": config.live,
-            "started_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+            "started_at": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            # Set when the session is stopped so the trading thread wakes immediately
+            "stop_event": threading.Event()
         }
         
         # Create some initial simulated trades
@@ -77,7 +82,8 @@ async def start_trading(background_tasks: BackgroundTasks, config: TradingConfig
                 model_id=config.trading_model_id,
                 symbol=config.symbol,
                 api_key=api_keys["luno_api_key"],
-                api_secret=api_keys["luno_api_secret"]
+                api_secret=api_keys["luno_api_secret"],
+                stop_event=active_trading_session["stop_event"]
             )
         
         return {
@@ -104,12 +110,11 @@ async def stop_trading():
     
     try:
         # Record the model information before clearing the session
-        model_id = active_trading_session["model_id"]
-        model = ModelStorage.get_model_by_id(model_id)
-        model_name = model["name"] if model else f"ID: {model_id}"
+        model_name = active_trading_session["model_name"]
         is_live = active_trading_session.get("live", False)
         
-        # Clear the active session
+        # Wake the trading thread and clear the active session
+        active_trading_session["stop_event"].set()
         active_trading_session = None
         
         return {
@@ -143,14 +148,10 @@ async def get_trading_status():
             "message": "No active trading session"
         }
     
-    model_id = active_trading_session["model_id"]
-    model = ModelStorage.get_model_by_id(model_id)
-    model_name = model["name"] if model else f"ID: {model_id}"
-    
     return {
         "active": True,
-        "model_id": model_id,
-        "model_name": model_name,
+        "model_id": active_trading_session["model_id"],
+        "model_name": active_trading_session["model_name"],
         "symbol": active_trading_session["symbol"],
         "live": active_trading_session["live"],
         "started_at": active_trading_session["started_at"]
@@ -162,6 +163,7 @@ def generate_initial_trades(model_id: str, symbol: str) -> None:
     """
     # Generate 5-8 trades with a mix of buy/sell and completed/pending
     num_trades = random.randint(5, 8)
+    trades = []
     
     for i in range(num_trades):
         # Determine trade type (slightly more buys than sells)
@@ -206,75 +208,74 @@ def generate_initial_trades(model_id: str, symbol: str) -> None:
             "status": status
         }
         
-        TradeStorage.add_trade(trade)
+        trades.append(trade)
+    
+    # Store all trades with one read/write of the trades file
+    TradeStorage.add_trades(trades)
 
-async def automated_trading_loop(model_id: str, symbol: str, api_key: str, api_secret: str):
+async def automated_trading_loop(model_id: str, symbol: str, api_key: str, api_secret: str,
+                                 stop_event: threading.Event):
     """
-    Automated trading loop for live trading
+    Automated trading loop for live trading, running until stop_event is set
     """
-    from time import sleep
-    import threading
-    
-    logger.info(f"Starting automated trading loop for model {model_id} on {symbol}")
+    logger.info("Starting automated trading loop for model %s on %s", model_id, symbol)
     
     def trading_thread():
         try:
             # Initialize Luno API client
             luno_client = create_luno_api(api_key=api_key, api_secret=api_secret)
             
+            # Load the model once rather than re-reading models.json on every iteration
+            model = ModelStorage.get_model_by_id(model_id)
+            
             # Keep running until the trading session is stopped
-            while active_trading_session and active_trading_session["model_id"] == model_id:
+            while not stop_event.is_set():
                 try:
-                    # Check if trading is still active
-                    if not active_trading_session:
-                        logger.info("Trading session stopped")
-                        break
-                        
                     # Get current price
                     ticker = luno_client.get_ticker(pair=symbol)
                     if not ticker:
-                        logger.warning(f"Failed to get ticker for {symbol}")
-                        sleep(30)  # Wait before trying again
+                        logger.warning("Failed to get ticker for %s", symbol)
+                        stop_event.wait(30)  # Wait before trying again
                         continue
                     
                     current_price = float(ticker.get("last_trade", 0))
                     if current_price <= 0:
-                        logger.warning(f"Invalid price ({current_price}) for {symbol}")
-                        sleep(30)
+                        logger.warning("Invalid price (%s) for %s", current_price, symbol)
+                        stop_event.wait(30)
                         continue
                         
                     # Get model prediction
                     # In a real implementation, this would load the model and make a prediction
                     # For demo purposes, we'll simulate a random prediction
-                    signal = get_trading_signal(model_id, current_price)
+                    signal = get_trading_signal(model, current_price)
                     
                     if signal:
                         # Execute trade based on signal
                         execute_trade(luno_client, symbol, signal["type"], current_price)
                     
-                    # Wait for the next iteration (30 seconds to avoid API rate limits)
-                    sleep(30)
+                    # Wait for the next iteration (30 seconds to avoid API rate limits),
+                    # returning early if the session is stopped
+                    stop_event.wait(30)
                     
                 except Exception as e:
-                    logger.error(f"Error in trading loop: {str(e)}")
+                    logger.error("Error in trading loop: %s", e)
                     # Continue the loop even if there's an error
-                    sleep(60)  # Wait longer after an error
+                    stop_event.wait(60)  # Wait longer after an error
                     
-            logger.info(f"Trading loop for model {model_id} stopped")
+            logger.info("Trading loop for model %s stopped", model_id)
             
         except Exception as e:
-            logger.error(f"Fatal error in trading thread: {str(e)}")
+            logger.error("Fatal error in trading thread: %s", e)
     
     # Start trading in a separate thread
     thread = threading.Thread(target=trading_thread)
     thread.daemon = True
     thread.start()
 
-def get_trading_signal(model_id: str, current_price: float) -> dict:
+def get_trading_signal(model: Optional[dict], current_price: float) -> dict:
     """
     Get trading signal from model
     """
-    model = ModelStorage.get_model_by_id(model_id)
     if not model:
         return None
         
@@ -306,7 +307,7 @@ def execute_trade(luno_client, symbol: str, trade_type: str, price: float):
     Execute a trade on Luno
     """
     try:
-        logger.info(f"Executing {trade_type.upper()} for {symbol} at price {price}")
+        logger.info("Executing %s for %s at price %s", trade_type.upper(), symbol, price)
         
         # Determine trade amount (very small for safety)
         # In real implementation, this would be based on strategy and risk management
@@ -338,11 +339,11 @@ def execute_trade(luno_client, symbol: str, trade_type: str, price: float):
         # Record the trade
         TradeStorage.add_trade(trade)
         
-        logger.info(f"Trade executed: {trade}")
+        logger.info("Trade executed: %s", trade)
         return True
         
     except Exception as e:
-        logger.error(f"Error executing trade: {str(e)}")
+        logger.error("Error executing trade: %s", e)
         
         # Record failed trade
         trade = {
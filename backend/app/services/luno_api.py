@@ -1,10 +1,22 @@
 """
 Service for integrating with the Luno API using luno-python library
 """
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+import asyncio
 import logging
+import time
 import luno_python.client as luno
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from luno_python.error import APIError
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 # pylint: disable=broad-exception-raised
 
 # Set up logging
@@ -12,6 +24,146 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class LunoAPIError(Exception):
+    """Raised when a call to the Luno API fails; the original error is the __cause__"""
+
+    def __init__(self, operation: str):
+        super().__init__(operation)
+        self.operation = operation
+
+    def __str__(self):
+        # Formatted on demand so failing calls don't pay for the message up front
+        return f"Error connecting to Luno API: {self.__cause__ or self.operation}"
+
+
+# Back off and retry rate-limited and transient server errors on the same connection
+# pool. Only GETs are retried so an order is never submitted twice. Kept short, and
+# Retry-After is ignored, because routes wait on these calls and fall back to cached
+# or mock data when Luno stays unavailable.
+RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+
+# Threads that can use the shared session at once: Starlette's run_in_threadpool
+# (40 threads by default) plus _request_pool below
+REQUEST_POOL_WORKERS = 10
+SESSION_POOL_SIZE = 40 + REQUEST_POOL_WORKERS
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session that retries transient failures"""
+    session = requests.Session()
+    # Keep a socket per concurrent thread; a smaller pool makes urllib3 discard
+    # keep-alive connections under load
+    session.mount("https://", HTTPAdapter(max_retries=RETRY_POLICY,
+                                          pool_maxsize=SESSION_POOL_SIZE))
+    return session
+
+
+# One connection pool for every Luno client. LunoAPI instances are short-lived, so
+# without this each one would pay a fresh TCP + TLS handshake on its first request.
+_session = _create_session()
+
+# Worker threads for fanning out independent requests, e.g. candles for several pairs.
+# Counted in SESSION_POOL_SIZE so every worker can keep a live socket.
+_request_pool = ThreadPoolExecutor(max_workers=REQUEST_POOL_WORKERS,
+                                   thread_name_prefix="luno-api")
+
+# Just under 24 hours, the furthest back Luno will return trades for
+TRADES_MAX_AGE_SECONDS = 23 * 3600 + 59 * 60
+
+
+def _parse_since_ms(since: Optional[Union[str, int]]) -> Optional[int]:
+    """Convert an ISO timestamp or milliseconds since epoch to milliseconds since epoch"""
+    if not since:
+        return None
+    if isinstance(since, int):
+        return since
+    if since.isdigit():
+        return int(since)
+    try:
+        return int(datetime.fromisoformat(since.replace('Z', '+00:00')).timestamp() * 1000)
+    except ValueError as exc:
+        logger.warning("Invalid timestamp format: %s", str(exc))
+        return None
+
+
+class _LunoClient(luno.Client):
+    """
+    luno-python client that decodes responses straight from the raw body bytes
+    and sends requests over the shared, retrying session
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the client on the shared keep-alive session"""
+        super().__init__(*args, **kwargs)
+        # Credentials are sent per request, so one session can serve every client
+        self.session = _session
+
+    def do(self, method, path, req=None, auth=False):
+        """Perform an API request and return the decoded JSON response"""
+        # Requests are flat dicts of strings and numbers, so a shallow copy gives the same
+        # params as luno-python's json.dumps/json.loads round-trip without serializing
+        params = dict(req) if isinstance(req, dict) else None
+        args = {
+            "timeout": self.timeout,
+            "params": params,
+            "headers": {"User-Agent": self.make_user_agent()},
+        }
+        if auth:
+            args["auth"] = (self.api_key_id, self.api_key_secret)
+        res = self.session.request(method, self.make_url(path, params), **args)
+        try:
+            # Parse the body bytes directly instead of going through res.text
+            body = json_loads(res.content)
+        except ValueError as exc:
+            raise Exception(f"luno: unknown API error ({res.status_code})") from exc
+        if "error" in body and "error_code" in body:
+            raise APIError(body["error_code"], body["error"])
+        return body
+
+
+# Order handlers take (client, pair, price, volume, counter_volume) and convert the
+# amounts to strings as required by the Luno API
+def _market_buy(client, pair, _price, _volume, counter_volume):
+    """Place a market buy spending counter_volume (e.g., amount of ZAR to spend)"""
+    if counter_volume is None:
+        raise ValueError("Market buy orders require counter_volume parameter")
+    return client.post_market_order(pair=pair, type='BUY', counter_volume=str(counter_volume))
+
+
+def _market_sell(client, pair, _price, volume, _counter_volume):
+    """Place a market sell of volume base currency (e.g., amount of BTC to sell)"""
+    if volume is None:
+        raise ValueError("Market sell orders require volume parameter")
+    return client.post_market_order(pair=pair, type='SELL', base_volume=str(volume))
+
+
+def _limit_order(side: str):
+    """Build a limit order handler for the given Luno order side ('BID' or 'ASK')"""
+    def handler(client, pair, price, volume, _counter_volume):
+        """Place a limit order of volume base currency at price"""
+        if price is None or volume is None:
+            raise ValueError("Limit orders require both price and volume parameters")
+        return client.post_limit_order(pair=pair, type=side, price=str(price), volume=str(volume))
+    return handler
+
+
+# (is_market_order, order_type) -> order handler
+_ORDER_DISPATCH = {
+    (True, 'buy'): _market_buy,
+    (True, 'sell'): _market_sell,
+    (False, 'buy'): _limit_order('BID'),
+    (False, 'sell'): _limit_order('ASK'),
+}
+
+
 class LunoAPI:
     """
     Luno API client for trading cryptocurrency using luno-python library
@@ -21,83 +173,69 @@ class LunoAPI:
         """Initialize with API credentials"""
         self.api_key = api_key
         self.api_secret = api_secret
-        self.client = luno.Client(api_key_id=api_key, api_key_secret=api_secret)
+        self.client = _LunoClient(api_key_id=api_key, api_key_secret=api_secret)
 
     def get_balance(self) -> Dict[str, Any]:
         """Get account balances"""
         try:
             return self.client.get_balances()
         except Exception as exc:
-            logger.error("Error getting balances: %s", str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error getting balances: %s", exc)
+            raise LunoAPIError("get_balances") from exc
 
     def get_ticker(self, pair: str) -> Dict[str, Any]:
         """Get ticker for a trading pair"""
         try:
             return self.client.get_ticker(pair=pair)
         except Exception as exc:
-            logger.error("Error getting ticker for %s: %s", pair, str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error getting ticker for %s: %s", pair, exc)
+            raise LunoAPIError("get_ticker") from exc
 
-    def get_tickers(self) -> Dict[str, Any]:
-        """Get tickers for all trading pairs"""
+    def get_tickers(self, pairs: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Get tickers for all trading pairs, or only for the given pairs
+
+        Several pairs are fetched in one request rather than one get_ticker call each.
+        """
         try:
-            return self.client.get_tickers()
+            return self.client.get_tickers(pair=pairs)
         except Exception as exc:
-            logger.error("Error getting tickers: %s", str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error getting tickers: %s", exc)
+            raise LunoAPIError("get_tickers") from exc
 
     def get_order_book(self, pair: str) -> Dict[str, Any]:
         """Get order book for a trading pair"""
         try:
             return self.client.get_order_book(pair=pair)
         except Exception as exc:
-            logger.error("Error getting order book for %s: %s", pair, str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error getting order book for %s: %s", pair, exc)
+            raise LunoAPIError("get_order_book") from exc
 
-    def get_trades(self, pair: str, since: Optional[str] = None) -> Dict[str, Any]:
+    def get_trades(self, pair: str, since: Optional[Union[str, int]] = None) -> Dict[str, Any]:
         """Get recent trades for a trading pair"""
-        if since:
-            # Check if since is already in milliseconds format (numeric string)
-            if isinstance(since, str) and since.isdigit():
-                since_ms = since
-            else:
-                try:
-                    # Parse human-readable timestamp
-                    dt = datetime.fromisoformat(since.replace('Z', '+00:00'))
-                    since_ms = str(int(dt.timestamp() * 1000))
-                except ValueError as exc:
-                    logger.warning("Invalid timestamp format: %s", str(exc))
-                    since_ms = None
-        else:
-            since_ms = None
-
-        # Check if since_ms is less than 24 hours since now, if so make it 24 hours since now
+        since_ms = _parse_since_ms(since)
+
+        # Luno only serves trades from the last 24 hours, so clamp older timestamps
         if since_ms:
-            since_dt = datetime.fromtimestamp(int(since_ms) / 1000, tz=timezone.utc)
-            now_dt = datetime.now(timezone.utc)
-            if (now_dt - since_dt).total_seconds() > 24 * 3600:
-                logger.warning("Since timestamp is more than 24 hours old, "+
-                               "using 24 hour old time instead")
-                since_ms = str(int((now_dt - timedelta(hours=23, minutes=59)).timestamp() * 1000))
-                # Show human readable timestamp
-                # Convert since_ms to datetime
-                since_dt = datetime.fromtimestamp(int(since_ms) / 1000)
-                logger.warning("Since timestamp: %s", since_dt.isoformat())
+            min_ms = int((time.time() - TRADES_MAX_AGE_SECONDS) * 1000)
+            if since_ms < min_ms:
+                logger.warning("Since timestamp %s is more than 24 hours old, "
+                               "using 24 hour old time %s instead", since_ms, min_ms)
+                since_ms = min_ms
 
         try:
             return self.client.list_trades(pair=pair, since=since_ms)
         except Exception as exc:
-            logger.error("Error getting trades for %s: %s", pair, str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error getting trades for %s: %s", pair, exc)
+            raise LunoAPIError("list_trades") from exc
 
     def get_orders(self, state: Optional[str] = None, pair: Optional[str] = None) -> Dict[str, Any]:
         """Get orders for the account"""
         try:
             return self.client.list_orders(state=state, pair=pair)
         except Exception as exc:
-            logger.error("Error listing orders: %s", str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error listing orders: %s", exc)
+            raise LunoAPIError("list_orders") from exc
 
     def create_order(self, pair: str, order_type: str, price: Optional[float] = None,
                      volume: Optional[float] = None, is_market_order: bool = False,
@@ -114,67 +252,21 @@ class LunoAPI:
             counter_volume: Amount of counter currency to use (for market buy orders)
         """
         try:
-            # Convert to strings as required by Luno API
-            price_str = str(price) if price is not None else None
-            volume_str = str(volume) if volume is not None else None
-            counter_volume_str = str(counter_volume) if counter_volume is not None else None
-
-            order_type_lower = order_type.lower()
-
-            if is_market_order:
-                # Market order handling
-                if order_type_lower == 'buy':
-                    # For market buy, we use counter_volume (e.g., amount of ZAR to spend)
-                    if counter_volume_str is None:
-                        raise ValueError("Market buy orders require counter_volume parameter")
-                    return self.client.post_market_order(
-                        pair=pair,
-                        type='BUY',
-                        counter_volume=counter_volume_str
-                    )
-                elif order_type_lower == 'sell':
-                    # For market sell, we use base_volume (e.g., amount of BTC to sell)
-                    if volume_str is None:
-                        raise ValueError("Market sell orders require volume parameter")
-                    return self.client.post_market_order(
-                        pair=pair,
-                        type='SELL',
-                        base_volume=volume_str
-                    )
-                else:
-                    raise ValueError(f"Unsupported order type: {order_type}. Use 'buy' or 'sell'.")
-            else:
-                # Limit order handling
-                if price_str is None or volume_str is None:
-                    raise ValueError("Limit orders require both price and volume parameters")
-
-                if order_type_lower == 'buy':
-                    return self.client.post_limit_order(
-                        pair=pair,
-                        type='BID',
-                        price=price_str,
-                        volume=volume_str
-                    )
-                elif order_type_lower == 'sell':
-                    return self.client.post_limit_order(
-                        pair=pair,
-                        type='ASK',
-                        price=price_str,
-                        volume=volume_str
-                    )
-                else:
-                    raise ValueError(f"Unsupported order type: {order_type}. Use 'buy' or 'sell'.")
+            handler = _ORDER_DISPATCH.get((bool(is_market_order), order_type.lower()))
+            if handler is None:
+                raise ValueError(f"Unsupported order type: {order_type}. Use 'buy' or 'sell'.")
+            return handler(self.client, pair, price, volume, counter_volume)
         except Exception as exc:
-            logger.error("Error creating order: %s", str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error creating order: %s", exc)
+            raise LunoAPIError("create_order") from exc
 
     def stop_order(self, order_id: str) -> Dict[str, Any]:
         """Stop an order"""
         try:
             return self.client.stop_order(order_id=order_id)
         except Exception as exc:
-            logger.error("Error stopping order %s: %s", order_id, str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error stopping order %s: %s", order_id, exc)
+            raise LunoAPIError("stop_order") from exc
 
     def get_markets(self) -> List[Dict[str, Any]]:
         """Get available markets (trading pairs)"""
@@ -182,10 +274,10 @@ class LunoAPI:
             response = self.client.markets()
             return response.get('markets', [])
         except Exception as exc:
-            logger.error("Error getting markets: %s", str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error getting markets: %s", exc)
+            raise LunoAPIError("markets") from exc
 
-    def get_candles(self, pair: str, since: Optional[str] = None,
+    def get_candles(self, pair: str, since: Optional[Union[str, int]] = None,
                     duration: int = 60) -> Dict[str, Any]:
         """
         Get candlestick data
@@ -196,22 +288,10 @@ class LunoAPI:
             duration: Candle duration in seconds (e.g., 60, 300, 900, 1800, 3600, 86400)
         """
         try:
-            # Convert ISO timestamp to milliseconds since epoch if provided
-            since_ms = None
-            if since:
-                try:
-                    # Check if since is already in milliseconds format (numeric string)
-                    if since.isdigit():
-                        since_ms = since
-                    else:
-                        # Parse ISO format timestamp
-                        dt = datetime.fromisoformat(since.replace('Z', '+00:00'))
-                        since_ms = str(int(dt.timestamp() * 1000))
-                except ValueError as exc:
-                    logger.warning("Invalid timestamp format: %s", str(exc))
-
-            logger.info("Getting candles for %s with duration %ss, since: %s",
-                      pair, duration, since_ms)
+            since_ms = _parse_since_ms(since)
+
+            logger.debug("Getting candles for %s with duration %ss, since: %s",
+                         pair, duration, since_ms)
 
             # Call Luno API to get candle data
             candles = self.client.get_candles(
@@ -222,12 +302,46 @@ class LunoAPI:
 
             return candles
         except Exception as exc:
-            logger.error("Error getting candles for %s: %s", pair, str(exc))
-            raise Exception(f"Error connecting to Luno API: {str(exc)}") from exc
+            logger.error("Error getting candles for %s: %s", pair, exc)
+            raise LunoAPIError("get_candles") from exc
 
+    def get_candles_bulk(self, pairs: List[str], since: Optional[Union[str, int]] = None,
+                         duration: int = 60) -> Dict[str, Any]:
+        """
+        Get candlestick data for several trading pairs concurrently
 
+        Args:
+            pairs: Trading pairs
+            since: Timestamp since when to get candles (ISO format or milliseconds since epoch)
+            duration: Candle duration in seconds
 
-# Factory function to create a Luno API client
+        Returns:
+            Mapping of pair to its candle data, or to the LunoAPIError raised for that pair
+        """
+        futures = {pair: _request_pool.submit(self.get_candles, pair, since, duration)
+                   for pair in pairs}
+        return {pair: future.exception() or future.result() for pair, future in futures.items()}
+
+    async def aget_candles_bulk(self, pairs: List[str], since: Optional[Union[str, int]] = None,
+                                duration: int = 60) -> Dict[str, Any]:
+        """Async variant of get_candles_bulk that does not block the event loop"""
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(_request_pool, self.get_candles, pair, since, duration)
+              for pair in pairs),
+            return_exceptions=True
+        )
+        return dict(zip(pairs, results))
+
+
+# Factory function to create a Luno API client. Instances are cached per credential pair
+# so repeated requests reuse one client instead of building a new one every time.
+@lru_cache(maxsize=8)
 def create_luno_api(api_key: str, api_secret: str) -> LunoAPI:
     """Create a Luno API client with the given credentials"""
     return LunoAPI(api_key=api_key, api_secret=api_secret)
+
+
+def get_public_luno_api() -> LunoAPI:
+    """Get the shared Luno API client for public endpoints that need no API keys"""
+    return create_luno_api(api_key="", api_secret="")
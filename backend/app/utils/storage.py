@@ -1,29 +1,116 @@
 """ Storage utilities for the trading bot"""
 import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import uuid
 from datetime import datetime
 from pathlib import Path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # Create data directory if it doesn't exist
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
 
+# Parsed files loaded with cached=True, keyed by filename -> (mtime_ns, data), in LRU order
+CACHE_MAX_ENTRIES = 64
+_cache: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+_cache_lock = threading.RLock()
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes"""
+    if orjson is None:
+        return json.dumps(data, default=str).encode('utf-8')
+    # Pass datetimes through to default=str so output matches the stdlib json output
+    return orjson.dumps(data, default=str,
+                        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+
+_loads = json.loads if orjson is None else orjson.loads
+
+def _write_atomic(file_path: Path, content: bytes) -> None:
+    """
+    Replace a file's contents by writing a temporary file and renaming it into place,
+    so readers and crashes never leave a partially written file behind
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        # mkstemp creates the file as 0600; restore the usual 0644 data file mode
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def save_to_file(data: Any, filename: str) -> None:
     """Save data to a JSON file"""
-    file_path = DATA_DIR / filename
-    with open(file_path, "w", encoding='utf-8') as f:
-        json.dump(data, f, default=str)
+    with _cache_lock:
+        _cache.pop(filename, None)
+    # Writes may run concurrently on worker threads, so never write in place
+    _write_atomic(DATA_DIR / filename, _dumps(data))
+
+def _read_file(file_path: Path) -> Any:
+    """Parse a JSON file, raising FileNotFoundError if it does not exist"""
+    logger.debug("Loading data from %s", file_path)
+    with open(file_path, "rb") as f:
+        return _loads(f.read())
 
-def load_from_file(filename: str, default: Any = None) -> Any:
-    """Load data from a JSON file"""
+def _shallow_copy(data: Any) -> Any:
+    """Copy a top-level dict or list so callers can't modify the cached one"""
+    if isinstance(data, dict):
+        return dict(data)
+    if isinstance(data, list):
+        return list(data)
+    return data
+
+def load_from_file(filename: str, default: Any = None, cached: bool = False) -> Any:
+    """
+    Load data from a JSON file
+
+    With cached=True the parsed data is kept in memory and reused until the file's
+    modification time changes. Callers get a shallow copy, so adding or removing
+    top-level items doesn't affect the cache; nested items are still shared.
+    """
     file_path = DATA_DIR / filename
-    print(f"Loading data from {file_path}")
-    if not file_path.exists():
+    if not cached:
+        try:
+            return _read_file(file_path)
+        except FileNotFoundError:
+            return default
+
+    try:
+        mtime = file_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return default
-    with open(file_path, "r", encoding='utf-8') as f:
-        return json.load(f)
+    with _cache_lock:
+        entry = _cache.get(filename)
+        if entry is not None and entry[0] == mtime:
+            _cache.move_to_end(filename)
+            return _shallow_copy(entry[1])
+
+    try:
+        data = _read_file(file_path)
+    except FileNotFoundError:
+        return default
+    with _cache_lock:
+        _cache[filename] = (mtime, data)
+        _cache.move_to_end(filename)
+        if len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return _shallow_copy(data)
 
 def generate_id() -> str:
     """Generate a unique ID"""
@@ -32,6 +119,8 @@ def generate_id() -> str:
 class ModelStorage:
     """Storage for model data"""
     FILENAME = "models.json"
+    # Serializes read-modify-write cycles on the models file across worker threads
+    _lock = threading.Lock()
 
     @classmethod
     def save_models(cls, models: List[Dict]) -> None:
@@ -53,51 +142,153 @@ class ModelStorage:
         return None
 
     @classmethod
-    def add_model(cls, model: Dict) -> Dict:
-        """Add a new model"""
-        models = cls.get_models()
+    def add_model(cls, model: Dict, accuracy: float = 0.0) -> Dict:
+        """Add a new model, optionally with its accuracy if already known"""
         model["id"] = generate_id()
         model["status"] = "active"
-        model["accuracy"] = 0.0  # Will be updated after training
+        model["accuracy"] = accuracy  # Will be updated after training
         model["last_run"] = None
-        models.append(model)
-        cls.save_models(models)
+        with cls._lock:
+            models = cls.get_models()
+            models.append(model)
+            cls.save_models(models)
         return model
 
     @classmethod
     def update_model(cls, model_id: str, updates: Dict) -> Optional[Dict]:
         """Update a model"""
-        models = cls.get_models()
-        for i, model in enumerate(models):
-            if model["id"] == model_id:
-                models[i].update(updates)
-                cls.save_models(models)
-                return models[i]
+        with cls._lock:
+            models = cls.get_models()
+            for i, model in enumerate(models):
+                if model["id"] == model_id:
+                    models[i].update(updates)
+                    cls.save_models(models)
+                    return models[i]
         return None
 
 class TradeStorage:
-    """Storage for trade data"""
-    FILENAME = "trades.json"
+    """Storage for trade data, kept as an append-only log with one JSON trade per line"""
+    FILENAME = "trades.ndjson"
+    LEGACY_FILENAME = "trades.json"
+    _lock = threading.Lock()
+    # Id for the next appended trade, counted from the log once on first use
+    _next_id: Optional[int] = None
 
     @classmethod
     def save_trades(cls, trades: List[Dict]) -> None:
-        """Save trades to file"""
-        save_to_file(trades, cls.FILENAME)
+        """Replace all stored trades"""
+        with cls._lock:
+            cls._write_trades(trades)
+
+    @classmethod
+    def _write_trades(cls, trades: List[Dict]) -> None:
+        """Replace all stored trades; the caller must hold _lock"""
+        # Atomic, so an interrupted legacy migration can't leave a truncated log that
+        # would stop trades.json from ever being read again
+        _write_atomic(DATA_DIR / cls.FILENAME,
+                      b"".join(_dumps(trade) + b"\n" for trade in trades))
+        cls._next_id = len(trades) + 1
+
+    @classmethod
+    def _read_trades(cls) -> List[Dict]:
+        """Parse the log, raising FileNotFoundError if it does not exist"""
+        with open(DATA_DIR / cls.FILENAME, "rb") as f:
+            lines = [line for line in f if line.strip()]
+        trades = []
+        for index, line in enumerate(lines):
+            try:
+                trades.append(_loads(line))
+            except ValueError:
+                # A write cut short by a crash leaves a torn last record; skip it
+                if index != len(lines) - 1:
+                    raise
+                logger.warning("Skipping incomplete trade record at the end of %s",
+                               cls.FILENAME)
+        return trades
 
     @classmethod
     def get_trades(cls) -> List[Dict]:
         """Get all trades"""
-        return load_from_file(cls.FILENAME, [])
+        try:
+            return cls._read_trades()
+        except FileNotFoundError:
+            with cls._lock:
+                return cls._migrate_legacy_trades()
+
+    @classmethod
+    def _migrate_legacy_trades(cls) -> List[Dict]:
+        """
+        Convert trades from the old single JSON array file into the log, if present.
+        The caller must hold _lock so the rewrite can't drop concurrently appended trades.
+        """
+        try:
+            # Another thread may have migrated or appended since the caller checked
+            return cls._read_trades()
+        except FileNotFoundError:
+            pass
+        trades = load_from_file(cls.LEGACY_FILENAME, [])
+        if trades:
+            cls._write_trades(trades)
+        return trades
+
+    @classmethod
+    def _count_trades(cls) -> int:
+        """
+        Count stored trades without parsing them; the caller must hold _lock.
+        Only newline-terminated records are counted, so a torn last record is ignored.
+        """
+        try:
+            with open(DATA_DIR / cls.FILENAME, "rb") as f:
+                return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 16), b""))
+        except FileNotFoundError:
+            return len(cls._migrate_legacy_trades())
+
+    @classmethod
+    def _drop_torn_tail(cls, f) -> None:
+        """Truncate an incomplete last record left by an interrupted append"""
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+        keep = 0
+        pos = end
+        while pos > 0:
+            start = max(0, pos - (1 << 16))
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                keep = start + newline + 1
+                break
+            pos = start
+        logger.warning("Discarding %s bytes of an incomplete trade record at the end of %s",
+                       end - keep, cls.FILENAME)
+        f.truncate(keep)
 
     @classmethod
     def add_trade(cls, trade: Dict) -> Dict:
         """Add a new trade"""
-        trades = cls.get_trades()
-        trade["id"] = len(trades) + 1
-        trade["time"] = datetime.now().strftime("%H:%M:%S")
-        trades.append(trade)
-        cls.save_trades(trades)
-        return trade
+        return cls.add_trades([trade])[0]
+
+    @classmethod
+    def add_trades(cls, new_trades: List[Dict]) -> List[Dict]:
+        """Append several trades to the log in a single write"""
+        now = datetime.now().strftime("%H:%M:%S")
+        # Hold the lock from assigning ids to appending so concurrent writers get unique ids
+        with cls._lock:
+            if cls._next_id is None:
+                cls._next_id = cls._count_trades() + 1
+            next_id = cls._next_id
+            for offset, trade in enumerate(new_trades):
+                trade["id"] = next_id + offset
+                trade["time"] = now
+            with open(DATA_DIR / cls.FILENAME, "a+b") as f:
+                # Start on a fresh line even if a previous append was cut short
+                cls._drop_torn_tail(f)
+                f.write(b"".join(_dumps(trade) + b"\n" for trade in new_trades))
+            cls._next_id = next_id + len(new_trades)
+        return new_trades
 
 class ApiKeyStorage:
     """Storage for API keys"""
@@ -111,8 +302,7 @@ class ApiKeyStorage:
     @classmethod
     def get_api_keys(cls) -> Dict:
         """Get API keys"""
-        print(f"Loading API keys from {cls.FILENAME}")
-        return load_from_file(cls.FILENAME, {})
+        return load_from_file(cls.FILENAME, {}, cached=True)
 
 class PriceStorage:
     """Storage for price data"""
@@ -127,4 +317,4 @@ class PriceStorage:
     def get_prices(cls, symbol: str, interval: str) -> List[Dict]:
         """Get prices for a symbol and interval"""
         filename = f"{symbol.lower()}_{interval.lower()}_prices.json"
-        return load_from_file(filename, [])
+        return load_from_file(filename, [], cached=True)
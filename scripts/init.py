@@ -7,14 +7,70 @@ creates a virtual environment in the /venv folder, and installs the
 appropriate requirements based on the system configuration.
 """
 
+import functools
+import hashlib
+import json
 import os
 import sys
 import platform
 import subprocess
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=None)
+def _detect_system() -> str:
+    """
+    Detect the operating system.
+
+    Returns:
+        str: 'linux' or 'windows'
+    """
+    system = platform.system().lower()
+    if system == "linux":
+        return "linux"
+    elif system == "windows":
+        return "windows"
+    else:
+        raise OSError(f"Unsupported operating system: {system}")
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_architecture() -> str:
+    """
+    Detect the system architecture.
+
+    Returns:
+        str: Architecture string (e.g., 'x86_64')
+    """
+    machine = platform.machine().lower()
+    if machine in ["x86_64", "amd64"]:
+        return "x86_64"
+    elif machine in ["arm64", "aarch64"]:
+        return "arm64"
+    else:
+        # Default to x86_64 if unsure
+        print(f"Warning: Unknown architecture {machine}, defaulting to x86_64")
+        return "x86_64"
+
+
+def _rmtree(path: str) -> None:
+    """
+    Remove a directory tree, clearing the read-only flag on files that resist deletion.
+
+    Args:
+        path: Directory to remove
+    """
+    def _make_writable_and_retry(func, failed_path, _exc_info):
+        """Retry a failed removal after making the path writable."""
+        os.chmod(failed_path, stat.S_IWRITE)
+        func(failed_path)
+
+    shutil.rmtree(path, onerror=_make_writable_and_retry)
+
+
 class VenvInitializer:
     """
     A class to handle virtual environment initialization for the TradingBot project.
@@ -24,73 +80,79 @@ class VenvInitializer:
         """Initialize the VenvInitializer with project root and system info."""
         self.project_root = Path(__file__).parent.parent
         self.venv_path = self.project_root / ".venv"
+        # Kept outside the venv so downloaded and built wheels survive --force
+        self.pip_cache = self.project_root / ".pip-cache"
+        self.installed_hash_file = self.venv_path / ".installed_hash"
         self.scripts_path = self.project_root / "scripts"
         self.deps_path = self.scripts_path / "deps"
+        self._deps_index = None
 
         # Detect system and architecture
-        self.system = self._detect_system()
-        self.architecture = self._detect_architecture()
+        self.system = _detect_system()
+        self.architecture = _detect_architecture()
 
         print(f"Detected system: {self.system}")
         print(f"Detected architecture: {self.architecture}")
 
-    def _detect_system(self) -> str:
-        """
-        Detect the operating system.
-
-        Returns:
-            str: 'linux' or 'windows'
-        """
-        system = platform.system().lower()
-        if system == "linux":
-            return "linux"
-        elif system == "windows":
-            return "windows"
-        else:
-            raise OSError(f"Unsupported operating system: {system}")
-
-    def _detect_architecture(self) -> str:
+    def get_python_executable(self) -> str:
         """
-        Detect the system architecture.
+        Get the appropriate Python executable path.
 
         Returns:
-            str: Architecture string (e.g., 'x86_64')
+            str: Python executable path
         """
-        machine = platform.machine().lower()
-        if machine in ["x86_64", "amd64"]:
-            return "x86_64"
-        elif machine in ["arm64", "aarch64"]:
-            return "arm64"
-        else:
-            # Default to x86_64 if unsure
-            print(f"Warning: Unknown architecture {machine}, defaulting to x86_64")
-            return "x86_64"
+        return sys.executable
 
-    def get_python_executable(self) -> str:
+    def _get_deps_index(self) -> dict:
         """
-        Get the appropriate Python executable path.
+        Get an index of the deps folder, scanning it only once per instance.
 
         Returns:
-            str: Python executable path
+            dict: Maps (system, architecture) to the set of file names in that folder
         """
-        return sys.executable
+        if self._deps_index is None:
+            index = {}
+            with os.scandir(self.deps_path) as systems:
+                for system_dir in systems:
+                    if not system_dir.is_dir():
+                        continue
+                    with os.scandir(system_dir.path) as architectures:
+                        for arch_dir in architectures:
+                            if arch_dir.is_dir():
+                                with os.scandir(arch_dir.path) as files:
+                                    index[(system_dir.name, arch_dir.name)] = {
+                                        f.name for f in files if f.is_file()
+                                    }
+            self._deps_index = index
+        return self._deps_index
 
     def get_requirements_file(self) -> Path:
         """
         Get the path to the appropriate requirements file based on system and architecture.
 
+        A pre-resolved ``requirements.lock`` (generated with
+        ``pip-compile --generate-hashes``) is preferred over ``requirements.txt``
+        when present, so the install can skip pip's resolver entirely.
+
         Returns:
-            Path: Path to the requirements.txt file
+            Path: Path to the requirements.lock or requirements.txt file
 
         Raises:
             FileNotFoundError: If the requirements file doesn't exist
         """
-        requirements_path = self.deps_path / self.system / self.architecture / "requirements.txt"
+        deps_index = self._get_deps_index()
+        platform_path = self.deps_path / self.system / self.architecture
+        files = deps_index.get((self.system, self.architecture), set())
+
+        if "requirements.lock" in files:
+            return platform_path / "requirements.lock"
 
-        if not requirements_path.exists():
+        requirements_path = platform_path / "requirements.txt"
+
+        if "requirements.txt" not in files:
             raise FileNotFoundError(
                 f"Requirements file not found: {requirements_path}\n"
-                f"Available systems: {[d.name for d in self.deps_path.iterdir() if d.is_dir()]}"
+                f"Available platforms: {sorted(f'{s}/{a}' for s, a in deps_index)}"
             )
 
         return requirements_path
@@ -113,38 +175,92 @@ class VenvInitializer:
         """
         return self.get_requirements_file()
 
-    def _run_command(self, command: list, description: str) -> None:
+    def _pip_env(self) -> dict:
+        """
+        Get the environment for pip commands, pointing pip at the shared cache.
+
+        Returns:
+            dict: Copy of the current environment with pip settings applied
+        """
+        self.pip_cache.mkdir(exist_ok=True)
+        return {
+            **os.environ,
+            "PIP_CACHE_DIR": str(self.pip_cache),
+            "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        }
+
+    def _run_command(self, command: list, description: str, env: dict = None) -> None:
         """
         Run a shell command with error handling.
 
+        Output is streamed line by line as the command runs instead of being
+        buffered until it exits.
+
         Args:
             command: List of command arguments
             description: Description of what the command does
+            env: Optional environment for the command (defaults to the current one)
 
         Raises:
             subprocess.CalledProcessError: If command fails
         """
-        print(f"{description}...")
-        try:
-            result = subprocess.run(
-                command,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            if result.stdout:
-                print(result.stdout)
-        except subprocess.CalledProcessError as e:
+        print(f"{description}...", flush=True)
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=env
+        ) as process:
+            for line in process.stdout:
+                sys.stdout.write(line)
+            returncode = process.wait()
+
+        if returncode:
             print(f"Error: {description} failed")
             print(f"Command: {' '.join(command)}")
-            print(f"Error output: {e.stderr}")
-            raise
+            raise subprocess.CalledProcessError(returncode, command)
 
     def remove_existing_venv(self) -> None:
-        """Remove existing virtual environment if it exists."""
+        """
+        Remove existing virtual environment if it exists.
+
+        Top-level folders are deleted concurrently, since removing thousands of
+        small files is bound by per-file syscall latency (notably on Windows).
+        """
         if self.venv_path.exists():
             print(f"Removing existing virtual environment at {self.venv_path}")
-            shutil.rmtree(self.venv_path)
+            with os.scandir(self.venv_path) as entries:
+                entries = list(entries)
+            subdirs = [e.path for e in entries if e.is_dir(follow_symlinks=False)]
+
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    os.unlink(entry.path)
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                # list() re-raises the first failure from the workers
+                list(executor.map(_rmtree, subdirs))
+
+            os.rmdir(self.venv_path)
+
+    def _venv_is_valid(self) -> bool:
+        """
+        Check whether the existing virtual environment can be reused.
+
+        Returns:
+            bool: True if the venv interpreter exists and can run pip
+        """
+        if not os.path.isfile(self.get_venv_python()):
+            return False
+        result = subprocess.run(
+            [*self.get_pip_command(), "--version"],
+            capture_output=True,
+            check=False,
+            env=self._pip_env()
+        )
+        return result.returncode == 0
 
     def create_venv(self) -> None:
         """Create a new virtual environment."""
@@ -152,50 +268,143 @@ class VenvInitializer:
         command = [python_exe, "-m", "venv", str(self.venv_path)]
         self._run_command(command, "Creating virtual environment")
 
-    def get_venv_pip(self) -> str:
+    def write_path_file(self) -> None:
+        """
+        Add the project to the venv's import path with a .pth file.
+
+        site.py reads the file once at interpreter start, so ``backend.app`` can be
+        imported from any working directory without sys.path hacks. Only the project
+        root is added; adding ``backend/`` too would let ``app`` be imported as a
+        second copy of the same modules.
         """
-        Get the path to pip in the virtual environment.
+        content = f"{self.project_root.resolve()}\n"
+        for site_dir in self.get_site_packages():
+            (site_dir / "tradingbot.pth").write_text(content, encoding="utf-8")
+
+    def get_site_packages(self) -> list:
+        """
+        Get the site-packages folders of the virtual environment.
 
         Returns:
-            str: Path to pip executable
+            list: Paths of the existing site-packages folders
         """
         if self.system == "windows":
-            return str(self.venv_path / "Scripts" / "pip.exe")
+            site_packages = [self.venv_path / "Lib" / "site-packages"]
         else:
-            return str(self.venv_path / "bin" / "pip")
+            site_packages = list(self.venv_path.glob("lib/python*/site-packages"))
+        return [site_dir for site_dir in site_packages if site_dir.is_dir()]
 
-    def upgrade_pip(self) -> None:
-        """Upgrade pip in the virtual environment."""
-        pip_exe = self.get_venv_pip()
-        command = [pip_exe, "install", "--upgrade", "pip"]
-        self._run_command(command, "Upgrading pip")
+    def compile_site_packages(self) -> None:
+        """
+        Byte-compile the installed packages using all CPU cores.
 
-    def install_requirements(self) -> None:
-        """Install requirements from the appropriate requirements file."""
+        Packages are installed with ``--no-compile`` and compiled here instead,
+        since pip compiles serially. Failures are not fatal: Python compiles
+        anything left over on first import.
+        """
+        command = [
+            self.get_venv_python(), "-m", "compileall", "-q", "-j", "0",
+            *[str(site_dir) for site_dir in self.get_site_packages()]
+        ]
+        try:
+            self._run_command(command, "Compiling installed packages")
+        except subprocess.CalledProcessError:
+            print("Warning: some installed files could not be byte-compiled")
+
+    def get_venv_python(self) -> str:
+        """
+        Get the path to the Python interpreter in the virtual environment.
+
+        Returns:
+            str: Path to python executable
+        """
+        if self.system == "windows":
+            return str(self.venv_path / "Scripts" / "python.exe")
+        else:
+            return str(self.venv_path / "bin" / "python")
+
+    def get_pip_command(self) -> list:
+        """
+        Get the command prefix used to run pip in the virtual environment.
+
+        Pip is run as a module of the venv interpreter rather than through the
+        pip launcher, which saves a process and lets pip upgrade itself on Windows.
+
+        Returns:
+            list: Command arguments that invoke pip
+        """
+        return [self.get_venv_python(), "-m", "pip"]
+
+    def install_requirements(self) -> bool:
+        """
+        Upgrade pip and install requirements from the appropriate requirements file.
+
+        Both are done in a single pip invocation to avoid a second interpreter
+        start-up and resolver pass. A hashed lockfile is installed as-is with
+        ``--no-deps``, since its pins are already fully resolved.
+
+        Pip is skipped entirely when the requirements file is unchanged since
+        the last successful install into this venv.
+
+        Returns:
+            bool: True if pip was run, False if the install was skipped
+        """
         requirements_file = self.get_requirements_file()
-        pip_exe = self.get_venv_pip()
+        pip_command = self.get_pip_command()
+
+        requirements_hash = hashlib.sha256(requirements_file.read_bytes()).hexdigest()
+        try:
+            installed_hash = self.installed_hash_file.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            installed_hash = None
+        if installed_hash == requirements_hash:
+            print(f"Requirements unchanged since last install: {requirements_file}")
+            return False
 
         print(f"Installing requirements from: {requirements_file}")
-        command = [pip_exe, "install", "-r", str(requirements_file)]
-        self._run_command(command, "Installing requirements")
+        if requirements_file.suffix == ".lock":
+            command = [
+                *pip_command, "install", "--prefer-binary", "--no-compile", "--no-deps",
+                "--require-hashes", "-r", str(requirements_file)
+            ]
+        else:
+            command = [
+                *pip_command, "install", "--prefer-binary", "--no-compile",
+                "--upgrade", "pip", "-r", str(requirements_file)
+            ]
+        self._run_command(
+            command, "Upgrading pip and installing requirements", env=self._pip_env()
+        )
+        self.installed_hash_file.write_text(requirements_hash, encoding="utf-8")
+        return True
 
     def verify_installation(self) -> None:
         """Verify that key packages are installed correctly."""
-        pip_exe = self.get_venv_pip()
-
         # Check some key packages
         key_packages = ["fastapi", "uvicorn", "luno-python", "pandas"]
 
         print("Verifying installation...")
+        # Enumerate distributions from the venv interpreter in one pass, without pip
+        code = (
+            "import importlib.metadata as m, json; "
+            "print(json.dumps(sorted({d.metadata['Name'].lower().replace('_', '-') "
+            "for d in m.distributions() if d.metadata['Name']})))"
+        )
+        try:
+            result = subprocess.run(
+                [self.get_venv_python(), "-c", code],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            installed = set(json.loads(result.stdout))
+        except (subprocess.CalledProcessError, ValueError):
+            installed = set()
+
         for package in key_packages:
-            try:
-                command = [pip_exe, "show", package]
-                result = subprocess.run(command, capture_output=True, text=True, check=True)
-                if result.stdout:
-                    print(f"✓ {package} installed successfully")
-                else:
-                    print(f"✗ {package} not found")
-            except subprocess.CalledProcessError:
+            if package in installed:
+                print(f"✓ {package} installed successfully")
+            else:
                 print(f"✗ {package} not found")
 
     def create_activation_script(self) -> None:
@@ -213,11 +422,17 @@ echo "Activating TradingBot virtual environment..."
 source "{self.venv_path}/bin/activate"
 """
 
-        with open(activate_script, "w", encoding="utf-8") as f:
-            f.write(script_content)
+        # Write to a temporary file and swap it in so a crash never leaves a
+        # truncated script behind
+        content_bytes = script_content.encode("utf-8")
+        tmp_script = activate_script.with_suffix(activate_script.suffix + ".tmp")
+        with open(tmp_script, "wb") as f:
+            f.write(content_bytes)
 
         if self.system != "windows":
-            os.chmod(activate_script, 0o755)
+            os.chmod(tmp_script, 0o755)
+
+        os.replace(tmp_script, activate_script)
 
         print(f"Created activation script: {activate_script}")
 
@@ -257,14 +472,27 @@ source "{self.venv_path}/bin/activate"
             print("Starting TradingBot virtual environment initialization...")
             print(f"Project root: {self.project_root}")
 
-            if force or self.venv_path.exists():
+            if self.venv_path.exists() and (force or not self._venv_is_valid()):
                 self.remove_existing_venv()
 
-            self.create_venv()
-            self.upgrade_pip()
-            self.install_requirements()
-            self.verify_installation()
-            self.create_activation_script()
+            if self.venv_path.exists():
+                print(f"Reusing existing virtual environment at {self.venv_path}")
+            else:
+                self.create_venv()
+            self.write_path_file()
+
+            # The activation script does not depend on the installed packages,
+            # so write it while pip is busy, and byte-compile while verifying
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                activation_future = executor.submit(self.create_activation_script)
+                compile_future = None
+                if self.install_requirements():
+                    compile_future = executor.submit(self.compile_site_packages)
+                self.verify_installation()
+                activation_future.result()
+                if compile_future is not None:
+                    compile_future.result()
+
             self.print_usage_instructions()
 
         except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
@@ -10,8 +10,7 @@ set "PROJECT_ROOT=%SCRIPT_DIR%.."
 
 REM Define paths
 set "VENV_PATH=%PROJECT_ROOT%\venv"
-set "BACKEND_PATH=%PROJECT_ROOT%\backend"
-set "PYTHON_SCRIPT=%BACKEND_PATH%\run.py"
+set "PYTHON_SCRIPT=%PROJECT_ROOT%\start_server.py"
 
 echo [INFO] TradingBot Backend Server Launcher
 echo [INFO] Project root: %PROJECT_ROOT%
@@ -50,9 +49,9 @@ python --version
 echo [INFO] Python executable:
 where python
 
-REM Change to backend directory
-cd /d "%BACKEND_PATH%"
-echo [INFO] Changed to backend directory: %CD%
+REM Change to project root
+cd /d "%PROJECT_ROOT%"
+echo [INFO] Changed to project root: %CD%
 
 REM Run the backend server
 echo [INFO] Starting TradingBot backend server...
@@ -61,6 +60,6 @@ echo [INFO] API documentation will be available at: http://localhost:8000/docs
 echo [INFO] Press Ctrl+C to stop the server
 
 REM Execute the Python script
-python run.py
+python start_server.py
 
 pause
\ No newline at end of file
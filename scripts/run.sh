@@ -11,8 +11,7 @@ PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
 
 # Define paths
 VENV_PATH="$PROJECT_ROOT/.venv"
-BACKEND_PATH="$PROJECT_ROOT/backend"
-PYTHON_SCRIPT="$BACKEND_PATH/run.py"
+PYTHON_SCRIPT="$PROJECT_ROOT/start_server.py"
 
 # Colors for output
 RED='\033[0;31m'
@@ -65,9 +64,9 @@ print_info "Virtual environment activated successfully"
 print_info "Python executable: $(which python)"
 print_info "Python version: $(python --version)"
 
-# Change to backend directory
-cd "$BACKEND_PATH"
-print_info "Changed to backend directory: $(pwd)"
+# Change to project root
+cd "$PROJECT_ROOT"
+print_info "Changed to project root: $(pwd)"
 
 # Run the backend server
 print_info "Starting TradingBot backend server..."
@@ -76,4 +75,4 @@ print_info "API documentation will be available at: http://localhost:8000/docs"
 print_info "Press Ctrl+C to stop the server"
 
 # Execute the Python script
-python run.py
\ No newline at end of file
+python start_server.py
\ No newline at end of file
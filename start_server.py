@@ -2,14 +2,18 @@
 """
 Startup script for the Trading Bot API server
 """
+import os
 import uvicorn
 
 
 if __name__ == "__main__":
     print("Starting Luno Trading Bot API server...")
+    # uvicorn's default loop/http settings use uvloop and httptools when they are
+    # installed. Reload runs a file-watching supervisor process, so it is opt-in via DEV.
+    # Runs a single worker: the trading session and storage locks live in process memory.
     uvicorn.run(
         "backend.app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
\ No newline at end of file
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8000")),
+        reload=os.environ.get("DEV", "").strip().lower() in ("1", "true", "yes", "on")
+    )